@@ -30,7 +30,9 @@ class Tags(TypedDict):
     encoder: str
 
 
-class Stream(TypedDict):
+# ffprobe is only asked for a subset of these fields (see processor._PROBE_ENTRIES),
+# so any key may be absent.
+class Stream(TypedDict, total=False):
     index: int
     codec_name: str
     codec_long_name: str
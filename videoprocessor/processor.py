@@ -1,27 +1,306 @@
 import argparse
+import asyncio
+import copy
 import json
 import os
+import shutil
 import subprocess
-from datetime import datetime as dt
-from typing import List
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from tempfile import NamedTemporaryFile
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from data_types import Stream, VideoInfo
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Resolved once so each call skips the PATH search; falls back to the bare name.
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+
+# Only the stream fields the getters below actually read.
+_PROBE_ENTRIES = ",".join(
+    (
+        "index",
+        "codec_name",
+        "codec_type",
+        "bit_rate",
+        "width",
+        "height",
+        "r_frame_rate",
+        "duration",
+        "sample_rate",
+    )
+)
+
+
+def _probe_cmd(path: str) -> List[str]:
+    """Builds the ffprobe argv used to inspect a video file.
 
-def check_float(val: str) -> bool:
-    """Checks if a string is a valid float.
+    Args:
+        path (str): Path to the video file.
+
+    Returns:
+        List[str]: The ffprobe command line.
+    """
+    return [
+        _FFPROBE,
+        "-v",
+        "quiet",
+        "-threads",
+        "0",
+        "-print_format",
+        "json",
+        "-show_entries",
+        f"stream={_PROBE_ENTRIES}",
+        path,
+    ]
+
+
+def _parse_probe_output(output: bytes) -> VideoInfo:
+    """Parses raw ffprobe JSON output.
 
     Args:
-        val (str): String to be checked.
+        output (bytes): ffprobe's stdout.
 
     Returns:
-        bool: True if the string is a valid float, False otherwise.
+        VideoInfo: Parsed video information, or an empty stream list on failure.
     """
     try:
-        _ = float(val)
-        return True
-    except ValueError:
-        return False
+        return json_loads(output)
+    except json.JSONDecodeError:
+        print("Failed to decode JSON. Output was:")
+        print(output.decode(errors="replace"))
+        return VideoInfo(streams=[])
+
+
+# ffprobe results keyed on (path, size, mtime_ns), shared by get_video_info()
+# and probe_many(); the least recently used entry is dropped past the limit.
+_PROBE_CACHE_SIZE = 128
+_probe_cache: "OrderedDict[Tuple[str, int, int], VideoInfo]" = OrderedDict()
+
+
+def _probe_key(path: str) -> Tuple[str, int, int]:
+    """Builds the cache key identifying the current version of a file.
+
+    Args:
+        path (str): Path to the video file.
+
+    Returns:
+        Tuple[str, int, int]: The path, its size and its modification time in nanoseconds.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(path)
+    return path, stat.st_size, stat.st_mtime_ns
+
+
+def _cache_lookup(key: Tuple[str, int, int]) -> Optional[VideoInfo]:
+    """Returns a cached probe result, marking it as recently used."""
+    info = _probe_cache.get(key)
+    if info is not None:
+        _probe_cache.move_to_end(key)
+    return info
+
+
+def _cache_store(key: Tuple[str, int, int], info: VideoInfo) -> None:
+    """Caches a probe result, evicting the least recently used one if full."""
+    _probe_cache[key] = info
+    _probe_cache.move_to_end(key)
+    if len(_probe_cache) > _PROBE_CACHE_SIZE:
+        _ = _probe_cache.popitem(last=False)
+
+
+def _check_probe(path: str, returncode: int, output: bytes) -> VideoInfo:
+    """Parses ffprobe's output after checking that it succeeded.
+
+    Args:
+        path (str): Path that was probed.
+        returncode (int): ffprobe's exit code.
+        output (bytes): ffprobe's stdout.
+
+    Returns:
+        VideoInfo: Parsed video information.
+
+    Raises:
+        subprocess.CalledProcessError: If ffprobe exited with a nonzero code.
+    """
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, _probe_cmd(path), output)
+    return _parse_probe_output(output)
+
+
+def _probe(path: str, size: int, mtime: int) -> VideoInfo:
+    """Runs ffprobe on a file, caching the result per file version.
+
+    Args:
+        path (str): Path to the video file.
+        size (int): File size in bytes, used only as part of the cache key.
+        mtime (int): Modification time in nanoseconds, used only as part of the cache key.
+
+    Returns:
+        VideoInfo: Parsed JSON output from ffprobe containing video information.
+
+    Raises:
+        subprocess.CalledProcessError: If ffprobe exited with a nonzero code.
+    """
+    key = (path, size, mtime)
+    info = _cache_lookup(key)
+    if info is None:
+        # ffprobe's stderr goes straight to ours; only stdout is piped, and its
+        # bytes are handed to the parser without a CompletedProcess/str copy.
+        with subprocess.Popen(_probe_cmd(path), stdout=subprocess.PIPE) as proc:
+            output = proc.stdout.read()
+        info = _check_probe(path, proc.returncode, output)
+        _cache_store(key, info)
+    return info
+
+
+# Characters escaped when embedding a path in a filtergraph: first as a
+# filter option value, then as part of the graph description.
+_FILTER_OPTION_ESCAPES = {ord(char): "\\" + char for char in "\\':"}
+_FILTER_GRAPH_ESCAPES = {ord(char): "\\" + char for char in "\\'[],;"}
+
+
+def _subtitles_filter(subs_path: str) -> str:
+    """Builds a ``subtitles`` filter for a file, escaping its path.
+
+    Args:
+        subs_path (str): Path to the subtitle file.
+
+    Returns:
+        str: Filter description safe to embed in ``-vf`` or ``-filter_complex``.
+    """
+    filename = subs_path.translate(_FILTER_OPTION_ESCAPES)
+    return "subtitles=filename=" + filename.translate(_FILTER_GRAPH_ESCAPES)
+
+
+# Hardware encoders to try for each source codec, in order of preference.
+_HW_ENCODERS = {
+    "h264": ("h264_nvenc", "h264_videotoolbox"),
+    "hevc": ("hevc_nvenc", "hevc_videotoolbox"),
+    "av1": ("av1_nvenc",),
+}
+
+# Software encoder names accepted in place of the codec they produce.
+_ENCODER_CODECS = {
+    "libx264": "h264",
+    "libx265": "hevc",
+    "libsvtav1": "av1",
+    "libaom-av1": "av1",
+}
+
+
+@lru_cache(maxsize=None)
+def _available_encoders() -> FrozenSet[str]:
+    """Lists the encoders compiled into the local ffmpeg build.
+
+    Returns:
+        FrozenSet[str]: Encoder names as reported by ``ffmpeg -encoders``.
+    """
+    result = subprocess.run(
+        [_FFMPEG, "-hide_banner", "-encoders"], text=True, capture_output=True
+    )
+    _, _, table = result.stdout.partition("------")
+    return frozenset(
+        fields[1] for fields in map(str.split, table.splitlines()) if len(fields) > 1
+    )
+
+# Encoders (and codec names ffmpeg resolves to them) that take -crf and x264-style -preset.
+_CRF_ENCODERS = frozenset(("libx264", "libx265", "h264", "hevc"))
+
+
+def _rate_control(encoder: str, crf: int, bitrate: Optional[str]) -> List[str]:
+    """Builds the rate-control arguments for an encoder.
+
+    Args:
+        encoder (str): Encoder (or codec) name passed to ``-c:v``.
+        crf (int): Constant rate factor used when no bitrate is given.
+        bitrate (str, optional): Target video bitrate.
+
+    Returns:
+        List[str]: ffmpeg arguments selecting the bitrate or constant quality.
+
+    Raises:
+        ValueError: If no bitrate is given and the encoder has no constant-quality mode we know.
+    """
+    if bitrate:
+        return ["-b:v", str(bitrate)]
+    if encoder.endswith("_nvenc"):
+        return ["-rc", "vbr", "-cq", str(crf)]
+    if encoder.endswith("_videotoolbox"):
+        # VideoToolbox quality runs 1-100, higher is better; map CRF's 0-51 onto it.
+        quality = max(1, min(100, round(100 * (51 - crf) / 51)))
+        return ["-q:v", str(quality)]
+    if encoder in _CRF_ENCODERS:
+        return ["-crf", str(crf), "-preset", "veryfast"]
+    raise ValueError(f"Encoder {encoder!r} does not support CRF; pass a bitrate")
+
+
+@lru_cache(maxsize=None)
+def _encoder_works(encoder: str, rate_args: Tuple[str, ...]) -> bool:
+    """Checks that an encoder runs on this machine by encoding one blank frame.
+
+    Builds often include hardware encoders (e.g. NVENC) without the hardware
+    to back them, so being listed by ``ffmpeg -encoders`` is not enough. The
+    rate-control arguments are part of the test because some are only
+    supported on certain hardware (e.g. VideoToolbox ``-q:v`` on Apple Silicon).
+
+    Args:
+        encoder (str): Encoder name, e.g. ``h264_nvenc``.
+        rate_args (Tuple[str, ...]): Rate-control arguments the real encode will use.
+
+    Returns:
+        bool: True if the test encode succeeded.
+    """
+    cmd = [
+        _FFMPEG,
+        "-v",
+        "error",
+        "-f",
+        "lavfi",
+        "-i",
+        "nullsrc=s=256x256",
+        "-frames:v",
+        "1",
+        "-c:v",
+        encoder,
+        *rate_args,
+        "-f",
+        "null",
+        "-",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def _hw_encoder(codec: str, crf: int, bitrate: Optional[str]) -> Optional[str]:
+    """Picks a working hardware encoder for a codec.
+
+    Args:
+        codec (str): Codec name, e.g. ``h264``, or a software encoder such as ``libx264``.
+        crf (int): Constant rate factor the encode will use without a bitrate.
+        bitrate (str, optional): Target video bitrate.
+
+    Returns:
+        str: Name of the hardware encoder, or None if none is usable for the codec
+            with these rate-control settings.
+    """
+    available = _available_encoders()
+    candidates = _HW_ENCODERS.get(_ENCODER_CODECS.get(codec, codec), ())
+    return next(
+        (
+            enc
+            for enc in candidates
+            if enc in available
+            and _encoder_works(enc, tuple(_rate_control(enc, crf, bitrate)))
+        ),
+        None,
+    )
 
 
 class VideoProcessor:
@@ -30,36 +309,113 @@ class VideoProcessor:
     Attributes:
         video_path (str): Path to the video file.
         info (dict): Information about the video file extracted using ffprobe.
+            Probed lazily on first access unless passed to the constructor.
     """
 
-    def __init__(self, video_path: str):
+    def __init__(self, video_path: str, info: Optional[VideoInfo] = None):
         """Initializes VideoProcessor with a specific video file.
 
         Args:
             video_path (str): Path to the video file to be processed.
+            info (VideoInfo, optional): Pre-fetched ffprobe output. Probed if omitted.
         """
         super().__init__()
         self.video_path = video_path
-        self.info: VideoInfo = self.get_video_info()
+        if info is not None:
+            self.info = info
+
+    @cached_property
+    def info(self) -> VideoInfo:
+        """Runs ffprobe the first time the video information is needed."""
+        return self.get_video_info()
+
+    @cached_property
+    def _by_type(self) -> Dict[str, Stream]:
+        """First stream of each codec_type, so getters are a single dict lookup."""
+        by_type: Dict[str, Stream] = {}
+        for stream in self.info["streams"]:
+            by_type.setdefault(stream["codec_type"], stream)
+        return by_type
+
+    @cached_property
+    def _frame_rate(self) -> Optional[float]:
+        """Frame rate of the video stream, parsed once."""
+        return self._parse_frame_rate(self._by_type.get("video"))
+
+    @staticmethod
+    def _parse_frame_rate(video_stream: Optional[Stream]) -> Optional[float]:
+        """Converts a stream's ``r_frame_rate`` fraction into frames per second.
+
+        Args:
+            video_stream (Stream, optional): The video stream to read.
+
+        Returns:
+            float: Frame rate of the stream, or None if not calculable.
+        """
+        if video_stream and video_stream.get("r_frame_rate"):
+            num, den = map(int, video_stream["r_frame_rate"].split("/"))
+            return num / den if den != 0 else None
+        return None
 
     def get_video_info(self):
         """Extracts video information using ffprobe.
 
         Returns:
             dict: Parsed JSON output from ffprobe containing video information.
+
+        Raises:
+            FileNotFoundError: If the video file does not exist.
+            subprocess.CalledProcessError: If ffprobe fails on the file.
         """
-        cmd = f'ffprobe -v quiet -print_format json -show_streams "{self.video_path}"'
-        result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+        # Copied so callers mutating their info can't alter the shared cache entry.
+        return copy.deepcopy(_probe(*_probe_key(self.video_path)))
 
-        if result.stderr:
-            print("Error:", result.stderr)
+    @classmethod
+    async def probe_many(
+        cls, paths: List[str], max_concurrency: Optional[int] = None
+    ) -> List["VideoProcessor"]:
+        """Probes several video files concurrently.
 
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
-            print("Failed to decode JSON. Output was:")
-            print(result.stdout)
-            return VideoInfo(streams=[])
+        Shares get_video_info()'s per-file cache: cached files are not probed
+        again, and new results are cached for later instances.
+
+        Args:
+            paths (List[str]): Paths to the video files.
+            max_concurrency (int, optional): Maximum number of ffprobe processes
+                running at once. Defaults to the number of CPUs.
+
+        Returns:
+            List[VideoProcessor]: One processor per path, in the same order.
+
+        Raises:
+            FileNotFoundError: If one of the video files does not exist.
+            subprocess.CalledProcessError: If ffprobe fails on one of the files.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or os.cpu_count() or 1)
+
+        async def probe(key: Tuple[str, int, int]) -> "VideoProcessor":
+            path = key[0]
+            info = _cache_lookup(key)
+            if info is None:
+                async with semaphore:
+                    proc = await asyncio.create_subprocess_exec(
+                        *_probe_cmd(path), stdout=asyncio.subprocess.PIPE
+                    )
+                    output, _ = await proc.communicate()
+                info = _check_probe(path, proc.returncode, output)
+                _cache_store(key, info)
+            return cls(path, copy.deepcopy(info))
+
+        # Stat everything first so a missing file fails before any ffprobe starts,
+        # and let every probe finish before re-raising so none is left orphaned.
+        keys = [_probe_key(path) for path in paths]
+        results = await asyncio.gather(
+            *(probe(key) for key in keys), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return list(results)
 
     def get_video_codec(self):
         """Retrieves the video codec of the video file.
@@ -67,15 +423,7 @@ class VideoProcessor:
         Returns:
             str: The video codec name, or 'copy' if not found.
         """
-        video_stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "video"
-            ),
-            None,
-        )
-        return video_stream.get("codec_name", "copy") if video_stream else "copy"
+        return self._by_type.get("video", {}).get("codec_name", "copy")
 
     def get_audio_codec(self):
         """Retrieves the audio codec of the video file.
@@ -83,15 +431,7 @@ class VideoProcessor:
         Returns:
             str: The audio codec name, or 'copy' if not found.
         """
-        audio_stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "audio"
-            ),
-            None,
-        )
-        return audio_stream["codec_name"] if audio_stream else "copy"
+        return self._by_type.get("audio", {}).get("codec_name", "copy")
 
     def get_video_bitrate(self):
         """Retrieves the bitrate of the video stream.
@@ -99,14 +439,7 @@ class VideoProcessor:
         Returns:
             str: Bitrate of the video, or '500k' as a default value.
         """
-        video_stream: Stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "video"
-            )
-        )
-        return video_stream.get("bit_rate", "500k")
+        return self._by_type.get("video", {}).get("bit_rate", "500k")
 
     def get_audio_bitrate(self):
         """Retrieves the bitrate of the audio stream.
@@ -114,15 +447,7 @@ class VideoProcessor:
         Returns:
             str: Bitrate of the audio, or None if not found.
         """
-        audio_stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "audio"
-            ),
-            None,
-        )
-        return audio_stream.get("bit_rate") if audio_stream else None
+        return self._by_type.get("audio", {}).get("bit_rate")
 
     def get_video_dimensions(self):
         """Retrieves the dimensions (width and height) of the video.
@@ -130,14 +455,7 @@ class VideoProcessor:
         Returns:
             tuple: Width and height of the video, or (None, None) if not found.
         """
-        video_stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "video"
-            ),
-            None,
-        )
+        video_stream = self._by_type.get("video")
         if video_stream:
             return video_stream.get("width"), video_stream.get("height")
         return None, None
@@ -148,15 +466,7 @@ class VideoProcessor:
         Returns:
             str: Sample rate of the audio, or None if not found.
         """
-        audio_stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "audio"
-            ),
-            None,
-        )
-        return audio_stream.get("sample_rate") if audio_stream else None
+        return self._by_type.get("audio", {}).get("sample_rate")
 
     def get_frame_rate(self):
         """Retrieves the frame rate of the video.
@@ -164,18 +474,7 @@ class VideoProcessor:
         Returns:
             float: Frame rate of the video, or None if not calculable.
         """
-        video_stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "video"
-            ),
-            None,
-        )
-        if video_stream and video_stream.get("r_frame_rate"):
-            num, den = map(int, video_stream["r_frame_rate"].split("/"))
-            return num / den if den != 0 else None
-        return None
+        return self._frame_rate
 
     def get_duration(self):
         """Retrieves the duration of the video.
@@ -183,34 +482,167 @@ class VideoProcessor:
         Returns:
             float: Duration of the video in seconds, or None if not found.
         """
-        video_stream: Stream = next(
-            (
-                stream
-                for stream in self.info["streams"]
-                if stream["codec_type"] == "video"
-            )
-        )
-        if not video_stream:
+        video_stream = self._by_type.get("video", {})
+        try:
+            return float(video_stream["duration"])
+        except (KeyError, TypeError, ValueError):
             return None
-        if video_stream.get("duration") and check_float(str(video_stream["duration"])):
-            duration = video_stream.get("duration")
-            if duration:
-                return float(duration)
-            else:
-                return None
-
-    def burn_subtitles(self, subs_path: str, output_path: str) -> int:
+
+    @staticmethod
+    def to_columns(processors: List["VideoProcessor"]) -> Dict[str, list]:
+        """Flattens the video metadata of several files into columns.
+
+        Each column holds one entry per processor, in order, so the result can
+        be filtered column-wise or handed straight to ``numpy.asarray`` or a
+        DataFrame constructor.
+
+        Args:
+            processors (List[VideoProcessor]): Processors to collect, e.g. from probe_many().
+
+        Returns:
+            Dict[str, list]: Columns keyed by ``video_path``, ``codec_name``, ``width``,
+                ``height``, ``bit_rate``, ``frame_rate`` and ``duration``; missing values are None.
+        """
+        columns: Dict[str, list] = {
+            "video_path": [],
+            "codec_name": [],
+            "width": [],
+            "height": [],
+            "bit_rate": [],
+            "frame_rate": [],
+            "duration": [],
+        }
+        for processor in processors:
+            video_stream = processor._by_type.get("video", {})
+            bit_rate = video_stream.get("bit_rate")
+            width, height = processor.get_video_dimensions()
+            columns["video_path"].append(processor.video_path)
+            columns["codec_name"].append(video_stream.get("codec_name"))
+            columns["width"].append(width)
+            columns["height"].append(height)
+            columns["bit_rate"].append(
+                int(bit_rate) if str(bit_rate).isdigit() else None
+            )
+            columns["frame_rate"].append(processor.get_frame_rate())
+            columns["duration"].append(processor.get_duration())
+        return columns
+
+    def burn_subtitles(
+        self,
+        subs_path: str,
+        output_path: str,
+        hw_encode: bool = False,
+        video_codec: Optional[str] = None,
+        bitrate: Optional[str] = None,
+        crf: int = 20,
+    ) -> int:
         """Burns subtitles into the video.
 
+        Quality is controlled with CRF unless a bitrate is given, so the video
+        does not need to be probed.
+
         Args:
             subs_path (str): Path to the subtitle file.
             output_path (str): Path for the output video file with subtitles.
+            hw_encode (bool): Re-encode with a hardware encoder for video_codec
+                (H.264 by default) if one passes a test encode on this machine
+                with the same rate-control settings. Otherwise the software
+                encoder is used.
+            video_codec (str, optional): Codec or encoder to encode with. Defaults to libx264.
+            bitrate (str, optional): Target video bitrate. Uses CRF rate control if omitted.
+            crf (int): Constant rate factor used without a bitrate. Hardware
+                encoders get the equivalent constant-quality setting.
+
+        Raises:
+            ValueError: If no bitrate is given and video_codec is not libx264,
+                libx265 (or h264/hevc), NVENC or VideoToolbox.
         """
-        video_codec = self.get_video_codec()
-        bitrate = self.get_video_bitrate()
+        encoder = (
+            _hw_encoder(video_codec or "h264", crf, bitrate) if hw_encode else None
+        )
 
-        ffmpeg_cmd = f"ffmpeg -i {self.video_path} -c:v {video_codec} -b:v {bitrate} -vf subtitles={subs_path} -c:a copy {output_path}"
-        result = subprocess.run(ffmpeg_cmd, shell=True)
+        ffmpeg_cmd = [_FFMPEG]
+        if encoder and encoder.endswith("_nvenc"):
+            # Decode on the GPU too; frames are downloaded for the subtitles
+            # filter, which only runs on system memory.
+            ffmpeg_cmd += ["-hwaccel", "cuda"]
+        encoder = encoder or video_codec or "libx264"
+        ffmpeg_cmd += ["-i", self.video_path, "-c:v", encoder]
+        ffmpeg_cmd += _rate_control(encoder, crf, bitrate)
+        ffmpeg_cmd += [
+            "-vf",
+            _subtitles_filter(subs_path),
+            "-c:a",
+            "copy",
+            output_path,
+        ]
+        result = subprocess.run(ffmpeg_cmd)
+        return result.returncode
+
+    @staticmethod
+    def burn_subtitles_batch(
+        pairs: List[Tuple[str, str]], output_pattern: str, crf: int = 20
+    ) -> int:
+        """Burns subtitles into several videos with a single ffmpeg process.
+
+        All inputs share one filter graph, so ffmpeg starts once instead of
+        once per file. Each video is re-encoded with libx264 as in burn_subtitles.
+
+        Args:
+            pairs (List[Tuple[str, str]]): (video_path, subs_path) pairs.
+            output_pattern (str): Output path format string; ``{index}`` and
+                ``{stem}`` (input file name without extension) are substituted.
+            crf (int): Constant rate factor for the encodes.
+
+        Raises:
+            ValueError: If output_pattern is malformed or maps two inputs to the same path.
+        """
+        if not pairs:
+            return 0
+
+        try:
+            output_paths = [
+                output_pattern.format(
+                    index=index,
+                    stem=os.path.splitext(os.path.basename(video_path))[0],
+                )
+                for index, (video_path, _) in enumerate(pairs)
+            ]
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid output pattern {output_pattern!r}: {exc}") from exc
+        resolved = {os.path.normcase(os.path.abspath(path)) for path in output_paths}
+        if len(resolved) != len(output_paths):
+            raise ValueError(
+                f"Output pattern {output_pattern!r} maps several inputs to the same path"
+            )
+
+        ffmpeg_cmd = [_FFMPEG]
+        for video_path, _ in pairs:
+            ffmpeg_cmd += ["-i", video_path]
+        ffmpeg_cmd += [
+            "-filter_complex",
+            ";".join(
+                f"[{index}:v]{_subtitles_filter(subs_path)}[v{index}]"
+                for index, (_, subs_path) in enumerate(pairs)
+            ),
+        ]
+        for index, output_path in enumerate(output_paths):
+            ffmpeg_cmd += [
+                "-map",
+                f"[v{index}]",
+                "-map",
+                f"{index}:a?",
+                "-c:v",
+                "libx264",
+                "-crf",
+                str(crf),
+                "-preset",
+                "veryfast",
+                "-c:a",
+                "copy",
+                output_path,
+            ]
+        result = subprocess.run(ffmpeg_cmd)
         return result.returncode
 
     @staticmethod
@@ -221,19 +653,39 @@ class VideoProcessor:
             input_videos (List[str]): A list of paths to the input video files.
             output_path (str): Path for the output concatenated video file.
         """
-        # with NamedTemporaryFile(mode="w+", delete=True) as temp_file:
-        temp_filename = f"temp_{int(dt.timestamp(dt.now()))}.txt"
-        result = None
-        with open(temp_filename, "w+") as temp_file:
-            for video in input_videos:
-                _ = temp_file.write(f"file '{video}'\n")
-            temp_file.flush()
-
-            ffmpeg_cmd = (
-                f"ffmpeg -f concat -safe 0 -i {temp_file.name} -c copy {output_path}"
+        # Single quotes are closed, escaped and reopened per the concat
+        # demuxer's quoting rules; fsencode keeps undecodable filename bytes
+        # intact (surrogateescape).
+        listing = os.fsencode(
+            "".join(
+                "file '" + video.replace("'", "'\\''") + "'\n"
+                for video in input_videos
             )
-            result = subprocess.run(ffmpeg_cmd, shell=True)
-        os.remove(temp_filename)
+        )
+
+        # Kept in the working directory so relative entries resolve as before;
+        # delete=False lets ffmpeg reopen the file on Windows.
+        with NamedTemporaryFile(
+            mode="wb", prefix="temp_", suffix=".txt", dir=".", delete=False
+        ) as temp_file:
+            _ = temp_file.write(listing)
+
+        try:
+            ffmpeg_cmd = [
+                _FFMPEG,
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                temp_file.name,
+                "-c",
+                "copy",
+                output_path,
+            ]
+            result = subprocess.run(ffmpeg_cmd)
+        finally:
+            os.remove(temp_file.name)
         return result.returncode
 
     @staticmethod
@@ -245,11 +697,22 @@ class VideoProcessor:
         _ = parser.add_argument("video_path", help="Path to the input video file")
         _ = parser.add_argument("subs_path", help="Path to the subtitle file")
         _ = parser.add_argument("output_path", help="Path for the output video file")
+        _ = parser.add_argument(
+            "--hw-encode",
+            action="store_true",
+            help="Use a hardware encoder (NVENC/VideoToolbox) if one works on this "
+            "machine, otherwise the software encoder",
+        )
 
         args = parser.parse_args()
 
         processor = VideoProcessor(args.video_path)
-        _ = processor.burn_subtitles(args.subs_path, args.output_path)
+        returncode = processor.burn_subtitles(
+            args.subs_path, args.output_path, hw_encode=args.hw_encode
+        )
+        if returncode != 0:
+            print(f"ffmpeg failed with exit code {returncode}")
+            raise SystemExit(returncode)
         print(f"Subtitles burned successfully to {args.output_path}")
 
 